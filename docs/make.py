@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+import hashlib
+import os
 from pathlib import Path
 import shutil
 import textwrap
 
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import FileSystemLoader
 from markupsafe import Markup
 import pygments.formatters.html
@@ -12,40 +18,34 @@ import pygments.lexers.python
 import pdoc.render
 
 here = Path(__file__).parent
+# Build caches live outside of docs/, which is uploaded as-is to GitHub Pages.
+cache_dir = here / ".." / ".cache" / "docs"
+demo = here / ".." / "test" / "testdata" / "demo.py"
 
-if __name__ == "__main__":
-    demo = here / ".." / "test" / "testdata" / "demo.py"
-    env = Environment(
-        loader=FileSystemLoader([here, here / ".." / "pdoc" / "templates"]),
-        autoescape=True,
-    )
+lexer = pygments.lexers.python.PythonLexer()
+formatter = pygments.formatters.html.HtmlFormatter(style="friendly")
 
-    lexer = pygments.lexers.python.PythonLexer()
-    formatter = pygments.formatters.html.HtmlFormatter(style="friendly")
-    pygments_css = formatter.get_style_defs()
-    example_html = Markup(pygments.highlight(demo.read_text("utf8"), lexer, formatter))
-
-    (here / "index.html").write_bytes(
-        env.get_template("index.html.jinja2")
-        .render(
-            example_html=example_html,
-            pygments_css=pygments_css,
-            __version__=pdoc.__version__,
-        )
-        .encode()
-    )
 
-    if (here / "docs").is_dir():
-        shutil.rmtree(here / "docs")
+def cached(name: str, key: bytes, make: Callable[[], str]) -> str:
+    """Return the HTML from `make()`, or the result of a previous build if it was made with the same key."""
+    digest = hashlib.blake2b(key + pygments.__version__.encode()).hexdigest()
+    file = cache_dir / "pygments" / f"{name}-{digest}.html"
+    if file.exists():
+        return file.read_bytes().decode()
+    result = make()
+    file.parent.mkdir(parents=True, exist_ok=True)
+    file.write_bytes(result.encode())
+    return result
 
-    # Render standalone demo (without any configuration)
-    pdoc.pdoc(
-        demo,
-        output_directory=here / "docs",
-    )
-    (here / "docs" / "demo.html").rename(here / "docs" / "demo-standalone.html")
 
-    # Render main docs
+def render_standalone_demo() -> None:
+    """Render standalone demo (without any configuration)"""
+    pdoc.render.configure()
+    (here / "docs" / "demo-standalone.html").write_bytes(pdoc.pdoc(demo).encode())
+
+
+def render_main_docs() -> None:
+    """Render main docs"""
     pdoc.render.configure(
         edit_url_map={
             "pdoc": "https://github.com/mitmproxy/pdoc/blob/main/pdoc/",
@@ -57,7 +57,6 @@ if __name__ == "__main__":
         logo_link="https://pdoc.dev",
         footer_text=f"pdoc {pdoc.__version__}",
     )
-
     pdoc.pdoc(
         "pdoc",
         demo,
@@ -65,11 +64,15 @@ if __name__ == "__main__":
         output_directory=here / "docs",
     )
 
-    # Render dark mode example
+
+def render_dark_mode_example() -> None:
+    """Render dark mode example"""
     pdoc.render.configure(template_directory=here / ".." / "examples" / "dark-mode")
     pdoc.pdoc(demo, output_directory=here / "docs" / "dark-mode")
 
-    # Render math example
+
+def render_math_example() -> None:
+    """Render math example"""
     pdoc.render.configure(
         math=True,
         logo="/logo.svg",
@@ -83,7 +86,9 @@ if __name__ == "__main__":
         output_directory=here / "docs" / "math",
     )
 
-    # Render mermaid example
+
+def render_mermaid_example() -> None:
+    """Render mermaid example"""
     pdoc.render.configure(
         mermaid=True,
         logo="/logo.svg",
@@ -97,21 +102,76 @@ if __name__ == "__main__":
         output_directory=here / "docs" / "mermaid",
     )
 
+
+if __name__ == "__main__":
+    jinja_cache = cache_dir / "jinja"
+    jinja_cache.mkdir(parents=True, exist_ok=True)
+    env = Environment(
+        loader=FileSystemLoader([here, here / ".." / "pdoc" / "templates"]),
+        autoescape=True,
+        bytecode_cache=FileSystemBytecodeCache(str(jinja_cache)),
+        auto_reload=False,
+    )
+
+    pygments_css = formatter.get_style_defs()
+    demo_source = demo.read_bytes()
+    example_html = Markup(
+        cached(
+            "demo",
+            demo_source,
+            lambda: pygments.highlight(demo_source.decode(), lexer, formatter),
+        )
+    )
+
+    env.get_template("index.html.jinja2").stream(
+        example_html=example_html,
+        pygments_css=pygments_css,
+        __version__=pdoc.__version__,
+    ).dump(str(here / "index.html"), encoding="utf-8")
+
+    if (here / "docs").is_dir():
+        shutil.rmtree(here / "docs")
+    (here / "docs").mkdir()
+
+    # The renders below are independent of each other, but pdoc.render.configure is process-global state.
+    # We run them in separate processes, each of which configures pdoc on its own.
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(f)
+            for f in (
+                render_standalone_demo,
+                render_main_docs,
+                render_dark_mode_example,
+                render_math_example,
+                render_mermaid_example,
+            )
+        ]
+        for future in as_completed(futures):
+            future.result()
+
     # Add sitemap.xml
-    with (here / "sitemap.xml").open("w", newline="\n") as f:
-        f.write(
-            textwrap.dedent(
-                """
-        <?xml version="1.0" encoding="utf-8"?>
-        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
-           xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-           xsi:schemaLocation="http://www.sitemaps.org/schemas/sitemap/0.9 http://www.sitemaps.org/schemas/sitemap/0.9/sitemap.xsd">
-        """
-            ).strip()
+    sitemap = [
+        textwrap.dedent(
+            """
+    <?xml version="1.0" encoding="utf-8"?>
+    <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+       xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+       xsi:schemaLocation="http://www.sitemaps.org/schemas/sitemap/0.9 http://www.sitemaps.org/schemas/sitemap/0.9/sitemap.xsd">
+    """
         )
-        for file in here.glob("**/*.html"):
-            if file.name.startswith("_"):
+        .strip()
+        .encode()
+    ]
+    here_str = str(here) + os.sep
+    for root, _, files in os.walk(here):
+        for name in files:
+            if not name.endswith(".html") or name.startswith("_"):
                 continue
-            filename = str(file.relative_to(here).as_posix()).replace("index.html", "")
-            f.write(f"""\n<url><loc>https://pdoc.dev/{filename}</loc></url>""")
-        f.write("""\n</urlset>""")
+            filename = os.path.join(root, name)[len(here_str) :].replace(os.sep, "/")
+            if name == "index.html":
+                filename = filename.removesuffix("index.html")
+            sitemap.append(
+                f"""\n<url><loc>https://pdoc.dev/{filename}</loc></url>""".encode()
+            )
+    sitemap.append(b"""\n</urlset>""")
+    (here / "sitemap.xml").write_bytes(b"".join(sitemap))
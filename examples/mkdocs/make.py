@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import os
 from pathlib import Path
 import shutil
 
@@ -15,5 +16,8 @@ render.configure(template_directory=here / "pdoc-template")
 pdoc("pdoc", "!pdoc.", "pdoc.doc", output_directory=out)
 
 # ...and rename the .html files to .md so that mkdocs picks them up!
-for f in out.glob("**/*.html"):
-    f.rename(f.with_suffix(".md"))
+for root, _, files in os.walk(out):
+    for name in files:
+        if name.endswith(".html"):
+            f = os.path.join(root, name)
+            os.rename(f, f[: -len(".html")] + ".md")
@@ -187,11 +187,10 @@ class Doc(Generic[T]):
 
         If no source file can be found, `None` is returned.
         """
-        try:
-            lines, start = inspect.getsourcelines(self.obj)  # type: ignore
-            return start, start + len(lines) - 1
-        except Exception:
+        if (source_lines := doc_ast.get_source_lines(self.obj)) is None:
             return None
+        lines, start = source_lines
+        return start, start + len(lines) - 1
 
     @cached_property
     def is_inherited(self) -> bool:
@@ -322,10 +321,11 @@ class Namespace(Doc[T], metaclass=ABCMeta):
                     default_value=obj,
                     taken_from=taken_from,
                 )
-            if self._var_docstrings.get(name):
-                doc.docstring = self._var_docstrings[name]
-            if self._func_docstrings.get(name) and not doc.docstring:
-                doc.docstring = self._func_docstrings[name]
+            if var_docstring := self._var_docstrings.get(name):
+                doc.docstring = var_docstring
+            if func_docstring := self._func_docstrings.get(name):
+                if not doc.docstring:
+                    doc.docstring = func_docstring
             members[doc.name] = doc
 
         if isinstance(self, Module):
@@ -531,12 +531,18 @@ class Module(Namespace[types.ModuleType]):
             # which may also modify obj.__dict__. (https://github.com/mitmproxy/pdoc/issues/351)
             for name, obj in list(self.obj.__dict__.items()):
                 # We already exclude everything here that is imported.
-                obj_module = inspect.getmodule(obj)
-                declared_in_this_module = self.obj.__name__ == _safe_getattr(
-                    obj_module, "__name__", None
-                )
-                include_in_docs = declared_in_this_module or name in self._ast_keys
-                if include_in_docs:
+                # Checking the AST is cheap, so we do that first and only determine
+                # the defining module for names that are not assigned in this module's source.
+                if name in self._ast_keys:
+                    members[name] = obj
+                    continue
+                # Most objects carry __module__, which saves us from the slower inspect.getmodule.
+                obj_modulename = _safe_getattr(obj, "__module__", None)
+                if not isinstance(obj_modulename, str):
+                    obj_modulename = _safe_getattr(
+                        inspect.getmodule(obj), "__name__", None
+                    )
+                if obj_modulename == self.obj.__name__:
                     members[name] = obj
 
             for name in self._var_docstrings:
@@ -1083,8 +1089,9 @@ class Variable(Doc[None]):
         must be passed manually in the constructor.
         """
         super().__init__(modulename, qualname, None, taken_from)
+        # Most variables don't have a docstring, so we skip cleandoc in that case.
         # noinspection PyPropertyAccess
-        self.docstring = inspect.cleandoc(docstring)
+        self.docstring = inspect.cleandoc(docstring) if docstring else ""
         self.annotation = annotation
         self.default_value = default_value
 
@@ -1335,11 +1342,15 @@ _Enum_default_docstrings = tuple(
 )
 
 
+_memory_address_pattern = re.compile(r" at 0x[0-9a-fA-F]+(?=>)")
+_collections_abc_pattern = re.compile(r"(?!\.)\bcollections\.abc\.")
+
+
 def _remove_memory_addresses(x: str) -> str:
     """Remove memory addresses from repr() output"""
-    return re.sub(r" at 0x[0-9a-fA-F]+(?=>)", "", x)
+    return _memory_address_pattern.sub("", x)
 
 
 def _remove_collections_abc(x: str) -> str:
     """Remove 'collections.abc' from type signatures."""
-    return re.sub(r"(?!\.)\bcollections\.abc\.", "", x)
+    return _collections_abc_pattern.sub("", x)
@@ -14,6 +14,7 @@ from functools import cache
 import inspect
 from itertools import tee
 from itertools import zip_longest
+import sys
 import types
 from typing import TYPE_CHECKING
 from typing import Any
@@ -44,10 +45,32 @@ def get_source(obj: Any) -> str:
 
 @cache
 def _get_source(obj: Any) -> str:
+    if (source_lines := get_source_lines(obj)) is None:
+        return ""
+    return "".join(source_lines[0])
+
+
+def get_source_lines(obj: Any) -> tuple[tuple[str, ...], int] | None:
+    """
+    Returns the source lines of the Python object `obj` and the line number of the first line,
+    similar to `inspect.getsourcelines`.
+
+    If this fails, `None` is returned.
+    """
+    # Some objects may not be hashable, so we fall back to the non-cached version if that is the case.
     try:
-        return inspect.getsource(obj)
+        return _get_source_lines(obj)
+    except TypeError:
+        return _get_source_lines.__wrapped__(obj)
+
+
+@cache
+def _get_source_lines(obj: Any) -> tuple[tuple[str, ...], int] | None:
+    try:
+        lines, start = inspect.getsourcelines(obj)
     except Exception:
-        return ""
+        return None
+    return tuple(lines), start
 
 
 @overload
@@ -68,13 +91,18 @@ def parse(obj):
     If an object's source code cannot be found, this function returns an empty ast node stub
     which can still be walked.
     """
-    src = get_source(obj)
     if isinstance(obj, types.ModuleType):
-        return _parse_module(src)
+        return _parse_module(get_source(obj))
     elif isinstance(obj, type):
-        return _parse_class(src)
+        # Before Python 3.13, inspect.getsource re-parses the entire module for every class,
+        # so we rather look up the class in the cached module tree.
+        # Python 3.13+ uses __firstlineno__ instead, which is faster than searching the tree.
+        if sys.version_info < (3, 13):  # pragma: no cover
+            if class_def := _find_class_def(obj):
+                return class_def
+        return _parse_class(get_source(obj))
     else:
-        return _parse_function(src)
+        return _parse_function(get_source(obj))
 
 
 @cache
@@ -246,6 +274,54 @@ def _parse_class(source: str) -> ast.ClassDef:
     return ast.ClassDef(name="PdocStub", body=[], decorator_list=[])  # type: ignore
 
 
+def _find_class_def(cls: type) -> ast.ClassDef | None:
+    """
+    Find the definition of `cls` in the syntax tree of its module, which is parsed only once per module.
+    Like `inspect.findsource` before Python 3.13, this returns the first class definition with a matching qualname,
+    but without parsing the module again for every class.
+
+    Returns `None` if the class definition cannot be found.
+    """
+    try:
+        module = sys.modules.get(cls.__module__)
+        qualname = cls.__qualname__
+        if module is None or not isinstance(qualname, str):
+            return None
+        return _class_defs(_parse_module(get_source(module))).get(qualname)
+    except Exception:
+        return None
+
+
+@cache
+def _class_defs(tree: ast.Module) -> dict[str, ast.ClassDef]:
+    """
+    Returns a qualname -> class definition mapping for all classes in tree, including nested classes.
+    If there are multiple definitions for the same qualname (for example in `if`/`else` branches),
+    the first one in the order `inspect` visits them wins.
+
+    Only statement bodies are visited, expressions can be nested too deeply to be walked.
+    """
+    class_defs: dict[str, ast.ClassDef] = {}
+    stack: list[tuple[ast.AST, str]] = [(tree, "")]
+    while stack:
+        node, prefix = stack.pop()
+        if isinstance(node, ast.ClassDef):
+            qualname = f"{prefix}{node.name}"
+            class_defs.setdefault(qualname, node)
+            prefix = f"{qualname}."
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            prefix = f"{prefix}{node.name}.<locals>."
+        # same order as ast.Try._fields, which is what inspect's class finder uses.
+        children = [
+            child
+            for field in ("body", "handlers", "orelse", "finalbody", "cases")
+            for child in getattr(node, field, [])
+        ]
+        # reversed, so that we visit nodes in source order.
+        stack.extend((child, prefix) for child in reversed(children))
+    return class_defs
+
+
 @cache
 def _parse_function(source: str) -> ast.FunctionDef | ast.AsyncFunctionDef:
     """
@@ -137,6 +137,8 @@ def parse_spec(spec: Path | str) -> str:
             return parse_spec(spec.resolve().parent) + f".{spec.stem}"
         parent_dir = str(spec.parent)
         sys.path = [parent_dir] + [x for x in sys.path if x != parent_dir]
+        # Imports that failed before may succeed with the new search path.
+        _failed_imports.clear()
         if spec.stem in sys.modules and sys.modules[spec.stem].__file__:
             local_dir = spec.resolve()
             file = sys.modules[spec.stem].__file__
@@ -211,14 +213,29 @@ def mock_some_common_side_effects():
         yield
 
 
-@mock_some_common_side_effects()
 def load_module(module: str) -> types.ModuleType:
     """Try to import a module. If import fails, a RuntimeError is raised.
 
     Returns the imported module."""
+    # Modules that have already been imported have no side effects left to mock.
+    if (mod := sys.modules.get(module)) is not None:
+        return mod
+    # Don't retry imports that have already failed, e.g. for every type annotation that references them.
+    if (err := _failed_imports.get(module)) is not None:
+        raise RuntimeError(f"Error importing {module}") from err
+    return _import_module(module)
+
+
+_failed_imports: dict[str, BaseException] = {}
+"""A mapping from module names to the exception raised when importing them. Cleared by `invalidate_caches`."""
+
+
+@mock_some_common_side_effects()
+def _import_module(module: str) -> types.ModuleType:
     try:
         return importlib.import_module(module)
     except AnyException as e:
+        _failed_imports[module] = e
         raise RuntimeError(f"Error importing {module}") from e
 
 
@@ -241,6 +258,8 @@ def iter_modules2(module: types.ModuleType) -> dict[str, pkgutil.ModuleInfo]:
          but are present in the module object.
     """
     mod_all = getattr(module, "__all__", None)
+    # __all__ may be long, so we do not want to scan it for every submodule.
+    all_names = None if mod_all is None else {x for x in mod_all if isinstance(x, str)}
 
     submodules = {}
 
@@ -248,7 +267,7 @@ def iter_modules2(module: types.ModuleType) -> dict[str, pkgutil.ModuleInfo]:
         getattr(module, "__path__", []), f"{module.__name__}."
     ):
         name = submodule.name.rpartition(".")[2]
-        if mod_all is None or name in mod_all:
+        if all_names is None or name in all_names:
             submodules[name] = submodule
 
     # 2023-12: PyO3 and pybind11 submodules are not detected by pkgutil
@@ -330,6 +349,8 @@ def invalidate_caches(module_name: str) -> None:
     # Getting this right is tricky – reloading modules causes a bunch of surprising side effects.
     # Our current best effort is to call `importlib.reload` on all modules that start with module_name.
     # We also exclude our own dependencies, which cause fun errors otherwise.
+    # Failed imports are retried in any case, the module may have been fixed in the meantime.
+    _failed_imports.clear()
     if module_name not in sys.modules:
         return
     if any(
@@ -350,6 +371,7 @@ def invalidate_caches(module_name: str) -> None:
     linecache.clearcache()
     pdoc.doc.Module.from_name.cache_clear()
     pdoc.doc_ast._get_source.cache_clear()
+    pdoc.doc_ast._get_source_lines.cache_clear()
     pdoc.docstrings.convert.cache_clear()
 
     prefix = f"{module_name}."
@@ -305,6 +305,37 @@ def module_candidates(identifier: str, current_module: str) -> Iterable[str]:
         yield identifier
 
 
+_linkify_pattern = re.compile(
+    r"""
+        # Part 1: foo.bar or foo.bar() (without backticks)
+        (?<![/=?#&\.])  # heuristic: not part of a URL
+        # First part of the identifier (e.g. "foo") - this is optional for relative references.
+        (?:
+            \b
+            (?!\d)[a-zA-Z0-9_]+
+            |
+            \.*  # We may also start with multiple dots.
+        )
+        # Rest of the identifier (e.g. ".bar" or "..bar")
+        (?:
+            # A single dot or a dot surrounded with pygments highlighting.
+            (?:\.|</span><span\ class="o">\.</span><span\ class="n">)
+            (?!\d)[a-zA-Z0-9_]+
+        )+
+        (?:\(\)|\b(?!\(\)))  # we either end on () or on a word boundary.
+        (?!</a>)  # not an existing link
+        (?![/#])  # heuristic: not part of a URL
+
+        | # Part 2: `foo` or `foo()`. `foo.bar` is already covered with part 1.
+        (?<=<code>)
+             (?!\d)[a-zA-Z0-9_]+
+        (?:\(\))?
+        (?=</code>(?!</a>))
+        """,
+    re.VERBOSE,
+)
+
+
 @pass_context
 def linkify(
     context: Context, code: str, namespace: str = "", shorten: bool = True
@@ -400,39 +431,7 @@ def linkify(
         # No matches found.
         return text
 
-    return Markup(
-        re.sub(
-            r"""
-            # Part 1: foo.bar or foo.bar() (without backticks)
-            (?<![/=?#&\.])  # heuristic: not part of a URL
-            # First part of the identifier (e.g. "foo") - this is optional for relative references.
-            (?:
-                \b
-                (?!\d)[a-zA-Z0-9_]+
-                |
-                \.*  # We may also start with multiple dots.
-            )
-            # Rest of the identifier (e.g. ".bar" or "..bar")
-            (?:
-                # A single dot or a dot surrounded with pygments highlighting.
-                (?:\.|</span><span\ class="o">\.</span><span\ class="n">)
-                (?!\d)[a-zA-Z0-9_]+
-            )+
-            (?:\(\)|\b(?!\(\)))  # we either end on () or on a word boundary.
-            (?!</a>)  # not an existing link
-            (?![/#])  # heuristic: not part of a URL
-
-            | # Part 2: `foo` or `foo()`. `foo.bar` is already covered with part 1.
-            (?<=<code>)
-                 (?!\d)[a-zA-Z0-9_]+
-            (?:\(\))?
-            (?=</code>(?!</a>))
-            """,
-            linkify_repl,
-            code,
-            flags=re.VERBOSE,
-        )
-    )
+    return Markup(_linkify_pattern.sub(linkify_repl, code))
 
 
 @pass_context
@@ -1,3 +1,8 @@
+import ast
+import importlib
+import inspect
+import sys
+import textwrap
 import types
 
 import pytest
@@ -62,3 +67,95 @@ def test_type_checking_sections(code, statements, monkeypatch):
     monkeypatch.setattr(doc_ast, "get_source", lambda _: code)
     mod = types.ModuleType("test_type_checking_sections")
     assert len(type_checking_sections(mod).body) == statements
+
+
+class _Outer:
+    class Inner:
+        pass
+
+
+def test_find_class_def():
+    """Classes should be looked up in the (cached) module tree instead of being parsed again."""
+    tree = doc_ast.parse(sys.modules[__name__])
+    outer = next(
+        x for x in tree.body if isinstance(x, ast.ClassDef) and x.name == "_Outer"
+    )
+    assert doc_ast._find_class_def(_Outer) is outer
+    assert doc_ast._find_class_def(_Outer.Inner) is outer.body[0]
+    assert doc_ast.parse(_Outer).name == "_Outer"
+
+    def make_local():
+        class Local:
+            x: int = 42
+
+        return Local
+
+    local = doc_ast._find_class_def(make_local())
+    assert local.name == "Local"
+    assert isinstance(local.body[0], ast.AnnAssign)
+
+
+def test_find_class_def_duplicate_qualname(tmp_path, monkeypatch):
+    (tmp_path / "pdoc_dup_mod.py").write_text(
+        textwrap.dedent(
+            """
+            if False:
+                class A:
+                    first: int
+            else:
+                class A:
+                    second: int
+
+            try:
+                pass
+            except Exception:
+                class B:
+                    first: int
+            else:
+                class B:
+                    second: int
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(tmp_path)
+    mod = importlib.import_module("pdoc_dup_mod")
+    try:
+        # Same as inspect before Python 3.13: the first definition wins,
+        # with exception handlers being visited before else branches.
+        for cls in (mod.A, mod.B):
+            class_def = doc_ast._find_class_def(cls)
+            assert isinstance(class_def.body[0], ast.AnnAssign)
+            assert class_def.body[0].target.id == "first"
+    finally:
+        del sys.modules["pdoc_dup_mod"]
+
+
+def test_find_class_def_not_in_tree():
+    dynamic = type("Dynamic", (), {"__module__": __name__})
+    assert doc_ast._find_class_def(dynamic) is None
+    assert doc_ast._find_class_def(type("Dynamic", (), {"__module__": 42})) is None
+    assert doc_ast._find_class_def(type("Dynamic", (), {"__module__": []})) is None
+    assert doc_ast.parse(dynamic).name == "PdocStub"
+
+
+def test_class_defs_deeply_nested_expression():
+    """Expressions can be nested too deeply to be walked recursively."""
+    expr: ast.expr = ast.Constant(1)
+    for _ in range(3000):
+        expr = ast.BinOp(expr, ast.Add(), ast.Constant(1))
+    class_def = ast.ClassDef(
+        name="Foo", bases=[], keywords=[], body=[ast.Pass()], decorator_list=[]
+    )
+    tree = ast.Module(
+        body=[ast.Assign(targets=[ast.Name("X")], value=expr), class_def],
+        type_ignores=[],
+    )
+    assert doc_ast._class_defs(tree) == {"Foo": class_def}
+
+
+def test_get_source_lines():
+    lines, start = inspect.getsourcelines(_Outer)
+    assert doc_ast.get_source_lines(_Outer) == (tuple(lines), start)
+    assert doc_ast.get_source(_Outer) == "".join(lines)
+    assert doc_ast.get_source_lines(int) is None
+    assert doc_ast.get_source(int) == ""
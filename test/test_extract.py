@@ -4,7 +4,9 @@ import sys
 
 import pytest
 
+from pdoc import extract
 from pdoc.extract import invalidate_caches
+from pdoc.extract import load_module
 from pdoc.extract import mock_some_common_side_effects
 from pdoc.extract import module_mtime
 from pdoc.extract import parse_spec
@@ -140,6 +142,36 @@ def test_invalidate_caches(monkeypatch):
         invalidate_caches("pdoc.render_helpers")
 
 
+def test_load_module(monkeypatch):
+    assert load_module("pdoc.extract") is sys.modules["pdoc.extract"]
+
+    # already imported modules are returned without importing them again.
+    monkeypatch.setattr(importlib, "import_module", None)
+    assert load_module("pdoc.extract") is sys.modules["pdoc.extract"]
+
+
+def test_load_module_failed_imports_are_cached(monkeypatch):
+    calls = []
+    import_module = extract._import_module
+
+    def count_calls(name):
+        calls.append(name)
+        return import_module(name)
+
+    monkeypatch.setattr(extract, "_import_module", count_calls)
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="Error importing pdoc_nonexistent"):
+            load_module("pdoc_nonexistent")
+    assert calls == ["pdoc_nonexistent"]
+
+    # live-reloading retries failed imports.
+    invalidate_caches("pdoc_nonexistent")
+    with pytest.raises(RuntimeError):
+        load_module("pdoc_nonexistent")
+    assert calls == ["pdoc_nonexistent", "pdoc_nonexistent"]
+    invalidate_caches("pdoc_nonexistent")
+
+
 def test_mock_sideeffects():
     """https://github.com/mitmproxy/pdoc/issues/745"""
     with mock_some_common_side_effects():